@@ -7,11 +7,16 @@ __all__ = [
     "ParsedFinal",
     "ReActAgent",
     "Tool",
+    "ToolLatency",
     "ToolRegistry",
+    "TraceArchive",
+    "TraceArchiveWriter",
+    "parse_json_output",
     "parse_llm_output",
 ]
 
 from .agent import ReActAgent
+from .archive import ToolLatency, TraceArchive, TraceArchiveWriter
 from .models import AgentResult, AgentStep
-from .parser import ParsedAction, ParsedFinal, parse_llm_output
+from .parser import ParsedAction, ParsedFinal, parse_json_output, parse_llm_output
 from .tools import Tool, ToolRegistry
@@ -1,20 +1,25 @@
 """Main ReAct agent loop."""
 
-from typing import Callable
+import json
+import time
+from typing import Callable, Literal
 
 from react_agent.models import AgentStep, AgentResult
 from react_agent.tools import ToolRegistry
-from react_agent.parser import parse_llm_output, ParsedFinal
+from react_agent.parser import parse_json_output, parse_llm_output, ParsedFinal
 
 DEFAULT_MAX_ITERATIONS = 10
 
+OutputFormat = Literal["text", "json"]
+
 
 class ReActAgent:
     """Agent that follows the ReAct (Reasoning + Acting) pattern.
 
     Alternates between reasoning (Thought) and acting (Action) steps,
     using an LLM to decide which tool to call and when to produce a
-    final answer.
+    final answer. With ``output_format="json"`` the LLM is asked to emit
+    a JSON action object, falling back to the text format when it doesn't.
     """
 
     def __init__(
@@ -22,10 +27,15 @@ class ReActAgent:
         llm_fn: Callable[[str], str],
         tools: ToolRegistry,
         max_iterations: int = DEFAULT_MAX_ITERATIONS,
+        output_format: OutputFormat = "text",
     ) -> None:
+        if output_format not in ("text", "json"):
+            raise ValueError(f"Unknown output format: {output_format}")
         self.llm_fn = llm_fn
         self.tools = tools
         self.max_iterations = max_iterations
+        self.output_format = output_format
+        self._parse = parse_json_output if output_format == "json" else parse_llm_output
 
     def run(self, question: str) -> AgentResult:
         """Execute the ReAct loop for a given question.
@@ -38,21 +48,31 @@ class ReActAgent:
 
         for _ in range(self.max_iterations):
             llm_response = self.llm_fn(prompt)
-            parsed = parse_llm_output(llm_response)
+            parsed = self._parse(llm_response)
 
             if isinstance(parsed, ParsedFinal):
                 return AgentResult(answer=parsed.answer, steps=steps, success=True)
 
+            failed = False
+            started = time.perf_counter()
             try:
                 observation = self.tools.execute(parsed.action, parsed.action_input)
             except Exception as e:
                 observation = f"Error: {e}"
+                failed = True
+            latency = time.perf_counter() - started
+
+            action_input = parsed.action_input
+            if not isinstance(action_input, str):
+                action_input = json.dumps(action_input)
 
             step = AgentStep(
                 thought=parsed.thought,
                 action=parsed.action,
-                action_input=parsed.action_input,
+                action_input=action_input,
                 observation=observation,
+                latency=latency,
+                failed=failed,
             )
             steps.append(step)
 
@@ -67,6 +87,18 @@ class ReActAgent:
     def _build_initial_prompt(self, question: str) -> str:
         """Build the initial prompt with tool descriptions and the user question."""
         tool_descriptions = self.tools.get_tool_descriptions()
+        if self.output_format == "json":
+            return (
+                f"Answer the following question using the available tools.\n\n"
+                f"Tools:\n{tool_descriptions}\n\n"
+                f"Reply with a single JSON object per turn, either\n"
+                f'{{"thought": "reason about what to do", "action": "tool_name", '
+                f'"action_input": {{...tool arguments...}}}}\n'
+                f"or, once you know the answer,\n"
+                f'{{"thought": "I now know the answer", "final_answer": "the final answer"}}\n'
+                f"Each tool result is returned as: Observation: tool result\n\n"
+                f"Question: {question}\n"
+            )
         return (
             f"Answer the following question using the available tools.\n\n"
             f"Tools:\n{tool_descriptions}\n\n"
@@ -0,0 +1,421 @@
+"""Columnar archive for persisting and scanning many agent runs."""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Iterator
+
+from react_agent.models import AgentResult, AgentStep
+
+MAGIC = b"RTRACE01"
+ALIGNMENT = 8
+
+# Column name and array typecode, in on-disk order. "B" columns holding
+# UTF-8 text are indexed by the matching "*_offsets" column (n + 1 entries).
+_SECTIONS: tuple[tuple[str, str], ...] = (
+    ("run_step_start", "Q"),
+    ("run_success", "B"),
+    ("answer_offsets", "Q"),
+    ("answer_data", "B"),
+    ("step_run", "I"),
+    ("step_action", "I"),
+    ("step_failed", "B"),
+    ("step_latency", "d"),
+    ("thought_offsets", "Q"),
+    ("thought_data", "B"),
+    ("input_offsets", "Q"),
+    ("input_data", "B"),
+    ("observation_offsets", "Q"),
+    ("observation_data", "B"),
+    ("action_offsets", "Q"),
+    ("action_data", "B"),
+)
+_BYTEORDER = b"<" if sys.byteorder == "little" else b">"
+_DIRECTORY = struct.Struct(f"={2 * len(_SECTIONS)}Q")
+_HEADER_SIZE = len(MAGIC) + ALIGNMENT + _DIRECTORY.size
+# Tool output decoded with "surrogateescape" may carry lone surrogates.
+_TEXT_ERRORS = "surrogatepass"
+
+
+@dataclass(slots=True)
+class ToolLatency:
+    """Aggregated execution latency, in seconds, for one tool."""
+
+    tool: str
+    calls: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class _TextColumn:
+    """Append-only UTF-8 buffer with an offsets array delimiting each string."""
+
+    def __init__(self) -> None:
+        self.offsets = array("Q", [0])
+        self.data = bytearray()
+
+    def append(self, encoded: bytes) -> None:
+        self.data += encoded
+        self.offsets.append(len(self.data))
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", _TEXT_ERRORS)
+
+
+class TraceArchiveWriter:
+    """Collect ``AgentResult`` objects and write them as a columnar archive.
+
+    Steps are stored column-wise: action names are interned into a small
+    table and referenced by id, text fields live in shared string buffers
+    addressed by offsets.
+
+    Every column is buffered in process memory until ``close()`` writes the
+    file, and opening a writer on an existing path replaces that archive
+    rather than appending to it. Runs added before a crash are lost, so for
+    long-running collection write one archive per batch (for example per
+    hour or per N runs) and query the shards separately.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._run_step_start = array("Q", [0])
+        self._run_success = array("B")
+        self._answers = _TextColumn()
+        self._step_run = array("I")
+        self._step_action = array("I")
+        self._step_failed = array("B")
+        self._step_latency = array("d")
+        self._thoughts = _TextColumn()
+        self._inputs = _TextColumn()
+        self._observations = _TextColumn()
+        self._actions = _TextColumn()
+        self._action_ids: dict[str, int] = {}
+        self._closed = False
+
+    def add(self, result: AgentResult) -> None:
+        """Append a single agent run to the archive.
+
+        Every field is encoded before any column is touched, so a run that
+        fails to encode leaves the archive unchanged.
+        """
+        if self._closed:
+            raise ValueError("Cannot add to a closed archive writer")
+        answer = _encode(result.answer)
+        encoded_steps = [
+            (
+                step.action,
+                _encode(step.action),
+                bool(step.failed),
+                float(step.latency),
+                _encode(step.thought),
+                _encode(step.action_input),
+                _encode(step.observation),
+            )
+            for step in result.steps
+        ]
+
+        run = len(self._run_success)
+        for action, action_bytes, failed, latency, thought, action_input, observation in (
+            encoded_steps
+        ):
+            action_id = self._action_ids.get(action)
+            if action_id is None:
+                action_id = self._action_ids[action] = len(self._action_ids)
+                self._actions.append(action_bytes)
+            self._step_run.append(run)
+            self._step_action.append(action_id)
+            self._step_failed.append(failed)
+            self._step_latency.append(latency)
+            self._thoughts.append(thought)
+            self._inputs.append(action_input)
+            self._observations.append(observation)
+        self._run_step_start.append(len(self._step_run))
+        self._run_success.append(result.success)
+        self._answers.append(answer)
+
+    def close(self) -> None:
+        """Write all buffered columns to ``path``. Safe to call twice.
+
+        The archive is written to a temporary file and moved into place, so
+        an existing file at ``path`` is only replaced by a complete archive.
+        If writing fails the buffered runs are kept and ``close()`` can be
+        retried.
+        """
+        if self._closed:
+            return
+        columns: dict[str, array | bytearray] = {
+            "run_step_start": self._run_step_start,
+            "run_success": self._run_success,
+            "answer_offsets": self._answers.offsets,
+            "answer_data": self._answers.data,
+            "step_run": self._step_run,
+            "step_action": self._step_action,
+            "step_failed": self._step_failed,
+            "step_latency": self._step_latency,
+            "thought_offsets": self._thoughts.offsets,
+            "thought_data": self._thoughts.data,
+            "input_offsets": self._inputs.offsets,
+            "input_data": self._inputs.data,
+            "observation_offsets": self._observations.offsets,
+            "observation_data": self._observations.data,
+            "action_offsets": self._actions.offsets,
+            "action_data": self._actions.data,
+        }
+
+        directory = []
+        position = _HEADER_SIZE
+        for name, _ in _SECTIONS:
+            position = _align(position)
+            size = len(memoryview(columns[name]).cast("B"))
+            directory.extend((position, size))
+            position += size
+
+        with tempfile.NamedTemporaryFile(
+            dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = Path(f.name)
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(MAGIC)
+                f.write(_BYTEORDER.ljust(ALIGNMENT, b"\0"))
+                f.write(_DIRECTORY.pack(*directory))
+                for (name, _), offset in zip(_SECTIONS, directory[::2]):
+                    f.write(b"\0" * (offset - f.tell()))
+                    f.write(columns[name])
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._closed = True
+
+    def discard(self) -> None:
+        """Drop all buffered runs without writing anything."""
+        self._closed = True
+
+    def __enter__(self) -> "TraceArchiveWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+
+class TraceArchive:
+    """Memory-mapped, read-only view over an archive written by ``TraceArchiveWriter``.
+
+    Columns are exposed as zero-copy ``memoryview`` casts over the mapping,
+    so queries scan only the columns they need and runs are materialised
+    back into ``AgentResult`` objects on demand. Opening only checks the
+    header, section sizes and column lengths; call ``validate()`` to scan
+    offsets and step references of an untrusted file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Not a trace archive: {self.path}") from None
+        self._view = memoryview(self._mmap)
+        self._columns: dict[str, memoryview] = {}
+        try:
+            self._load_columns()
+            self._check_columns()
+            self._action_names = [
+                self._text("action", i) for i in range(len(self._columns["action_offsets"]) - 1)
+            ]
+        except ValueError:
+            self.close()
+            raise
+        self._action_ids = {name: i for i, name in enumerate(self._action_names)}
+
+    def _load_columns(self) -> None:
+        if len(self._view) < _HEADER_SIZE or self._view[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a trace archive: {self.path}")
+        byteorder = bytes(self._view[len(MAGIC) : len(MAGIC) + 1])
+        if byteorder != _BYTEORDER:
+            raise ValueError(f"Trace archive byte order does not match this machine: {self.path}")
+        directory = _DIRECTORY.unpack_from(self._view, len(MAGIC) + ALIGNMENT)
+        for (name, typecode), offset, size in zip(_SECTIONS, directory[::2], directory[1::2]):
+            if offset + size > len(self._view):
+                raise ValueError(f"Truncated trace archive: {self.path}")
+            if offset % ALIGNMENT or size % struct.calcsize(typecode):
+                raise ValueError(f"Corrupt trace archive section '{name}': {self.path}")
+            self._columns[name] = self._view[offset : offset + size].cast(typecode)
+
+    def _check_columns(self) -> None:
+        columns = self._columns
+        runs = len(columns["run_success"])
+        steps = len(columns["step_run"])
+        expected_lengths = {
+            "run_step_start": runs + 1,
+            "answer_offsets": runs + 1,
+            "step_action": steps,
+            "step_failed": steps,
+            "step_latency": steps,
+            "thought_offsets": steps + 1,
+            "input_offsets": steps + 1,
+            "observation_offsets": steps + 1,
+        }
+        for name, length in expected_lengths.items():
+            if len(columns[name]) != length:
+                raise ValueError(f"Corrupt trace archive section '{name}': {self.path}")
+
+        for name, limit in self._offset_bounds().items():
+            offsets = columns[name]
+            if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != limit:
+                raise ValueError(f"Corrupt trace archive section '{name}': {self.path}")
+        # The action table is tiny and decoded eagerly, so check it in full here.
+        if not _is_non_decreasing(columns["action_offsets"]):
+            raise ValueError(f"Corrupt trace archive section 'action_offsets': {self.path}")
+
+    def _offset_bounds(self) -> dict[str, int]:
+        columns = self._columns
+        bounds = {"run_step_start": len(columns["step_run"])}
+        for column in ("answer", "thought", "input", "observation", "action"):
+            bounds[f"{column}_offsets"] = len(columns[f"{column}_data"])
+        return bounds
+
+    def _require_open(self) -> dict[str, memoryview]:
+        if not self._columns:
+            raise ValueError("archive is closed")
+        return self._columns
+
+    def validate(self) -> None:
+        """Scan every offset and step column, raising ``ValueError`` on corruption.
+
+        This is linear in the size of the archive, so it is not run on open.
+        """
+        columns = self._require_open()
+        for name in self._offset_bounds():
+            if not _is_non_decreasing(columns[name]):
+                raise ValueError(f"Corrupt trace archive section '{name}': {self.path}")
+        runs = len(columns["run_success"])
+        actions = len(self._action_names)
+        if any(run >= runs for run in columns["step_run"]) or any(
+            action >= actions for action in columns["step_action"]
+        ):
+            raise ValueError(f"Corrupt trace archive step references: {self.path}")
+
+    def _text(self, column: str, index: int) -> str:
+        offsets = self._columns[f"{column}_offsets"]
+        data = self._columns[f"{column}_data"][offsets[index] : offsets[index + 1]]
+        return str(data, "utf-8", _TEXT_ERRORS)
+
+    def __len__(self) -> int:
+        return len(self._require_open()["run_success"])
+
+    @property
+    def step_count(self) -> int:
+        """Total number of steps across all runs."""
+        return len(self._require_open()["step_run"])
+
+    @property
+    def actions(self) -> list[str]:
+        """Distinct action names, in order of first appearance."""
+        self._require_open()
+        return list(self._action_names)
+
+    def result(self, index: int) -> AgentResult:
+        """Materialise run *index* as an ``AgentResult``."""
+        columns = self._require_open()
+        if not 0 <= index < len(columns["run_success"]):
+            raise IndexError(f"Run index out of range: {index}")
+        step_start = columns["run_step_start"]
+        step_action = columns["step_action"]
+        step_latency = columns["step_latency"]
+        step_failed = columns["step_failed"]
+        steps = [
+            AgentStep(
+                thought=self._text("thought", i),
+                action=self._action_names[step_action[i]],
+                action_input=self._text("input", i),
+                observation=self._text("observation", i),
+                latency=step_latency[i],
+                failed=bool(step_failed[i]),
+            )
+            for i in range(step_start[index], step_start[index + 1])
+        ]
+        return AgentResult(
+            answer=self._text("answer", index),
+            steps=steps,
+            success=bool(columns["run_success"][index]),
+        )
+
+    def __iter__(self) -> Iterator[AgentResult]:
+        for index in range(len(self)):
+            yield self.result(index)
+
+    def failed_runs(self, tool: str) -> list[int]:
+        """Return the indices of runs where *tool* returned an error at least once."""
+        columns = self._require_open()
+        action_id = self._action_ids.get(tool)
+        if action_id is None:
+            return []
+        runs: list[int] = []
+        for run, action, failed in zip(
+            columns["step_run"], columns["step_action"], columns["step_failed"]
+        ):
+            if failed and action == action_id and (not runs or runs[-1] != run):
+                runs.append(run)
+        return runs
+
+    def latency_by_tool(self) -> dict[str, ToolLatency]:
+        """Aggregate step latency per tool over the whole archive."""
+        columns = self._require_open()
+        stats = [ToolLatency(tool=name) for name in self._action_names]
+        for action, latency in zip(columns["step_action"], columns["step_latency"]):
+            entry = stats[action]
+            entry.calls += 1
+            entry.total += latency
+            if latency > entry.maximum:
+                entry.maximum = latency
+        return {entry.tool: entry for entry in stats}
+
+    def close(self) -> None:
+        """Release the memory mapping and the underlying file."""
+        for column in self._columns.values():
+            column.release()
+        self._columns.clear()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "TraceArchive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _is_non_decreasing(offsets: memoryview) -> bool:
+    return all(a <= b for a, b in zip(offsets, offsets[1:]))
+
+
+def _align(position: int) -> int:
+    return -(-position // ALIGNMENT) * ALIGNMENT
@@ -3,17 +3,23 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStep:
-    """A single Thought-Action-Observation step in the ReAct loop."""
+    """A single Thought-Action-Observation step in the ReAct loop.
+
+    ``latency`` is the wall-clock time, in seconds, spent executing the tool
+    and ``failed`` is set when the tool call raised.
+    """
 
     thought: str
     action: str
     action_input: str
     observation: str
+    latency: float = 0.0
+    failed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     """Final outcome of an agent run, including all intermediate steps."""
 
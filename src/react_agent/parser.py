@@ -1,10 +1,15 @@
 """LLM output parser for the ReAct agent."""
 
+import json
 import re
 from dataclasses import dataclass
+from typing import Any
 
 ERROR_PREVIEW_CHARS = 100
 
+_JSON_DECODER = json.JSONDecoder()
+_TEXT_MARKER_RE = re.compile(r"Action:|Action Input:|Final Answer:")
+
 
 @dataclass
 class ParsedAction:
@@ -12,7 +17,7 @@ class ParsedAction:
 
     thought: str
     action: str
-    action_input: str
+    action_input: str | dict[str, Any]
 
 
 @dataclass
@@ -47,3 +52,57 @@ def parse_llm_output(text: str) -> ParsedAction | ParsedFinal:
         action=action_match.group(1).strip(),
         action_input=input_match.group(1).strip() if input_match else "",
     )
+
+
+def parse_json_output(text: str) -> ParsedAction | ParsedFinal:
+    """Parse an LLM response that carries a JSON action object.
+
+    Expects ``{"thought": ..., "action": ..., "action_input": ...}`` or
+    ``{"thought": ..., "final_answer": ...}`` somewhere in the text (prose,
+    code fences or a hallucinated ``Observation:`` around it are ignored).
+    Objects are decoded in place from each candidate ``{`` and the first
+    valid one wins. Falls back to ``parse_llm_output`` when no such object is
+    found, or when text-format markers appear outside it (so JSON inside an
+    ``Action Input`` is left alone).
+    """
+    pos = text.find("{")
+    while pos != -1:
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            pos = text.find("{", pos + 1)
+            continue
+
+        parsed = _from_json_object(obj)
+        if parsed is not None:
+            if _TEXT_MARKER_RE.search(text, 0, pos) or _TEXT_MARKER_RE.search(text, end):
+                break
+            return parsed
+        pos = text.find("{", end)
+
+    return parse_llm_output(text)
+
+
+def _from_json_object(obj: Any) -> ParsedAction | ParsedFinal | None:
+    """Convert a decoded JSON object into a parsed result, if it is one."""
+    if not isinstance(obj, dict):
+        return None
+    thought = obj.get("thought")
+    thought = thought.strip() if isinstance(thought, str) else ""
+
+    answer = obj.get("final_answer")
+    if answer is not None:
+        if not isinstance(answer, str):
+            answer = json.dumps(answer)
+        return ParsedFinal(thought=thought, answer=answer.strip())
+
+    action = obj.get("action")
+    if not isinstance(action, str) or not action.strip():
+        return None
+
+    action_input = obj.get("action_input", "")
+    if action_input is None:
+        action_input = ""
+    elif not isinstance(action_input, (str, dict)):
+        action_input = json.dumps(action_input)
+    return ParsedAction(thought=thought, action=action.strip(), action_input=action_input)
@@ -1,14 +1,19 @@
 """Tool registry for the ReAct agent."""
 
+import json
 from dataclasses import dataclass
-from typing import Callable
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
 
 
 @dataclass
 class Tool:
     name: str
     description: str
-    func: Callable[[str], str]
+    func: Callable[[Any], str]
+    args_schema: type | None = None
+    validator: TypeAdapter | None = None
 
 
 class ToolRegistry:
@@ -17,9 +22,27 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
 
-    def register(self, name: str, description: str, func: Callable[[str], str]) -> None:
-        """Register a tool with its name, description, and callable."""
-        self._tools[name] = Tool(name=name, description=description, func=func)
+    def register(
+        self,
+        name: str,
+        description: str,
+        func: Callable[[Any], str],
+        args_schema: type | None = None,
+    ) -> None:
+        """Register a tool with its name, description, and callable.
+
+        When *args_schema* is given (a pydantic model, dataclass or
+        ``TypedDict``), its validator is built once here and the tool
+        receives the validated arguments instead of a raw string.
+        """
+        validator = TypeAdapter(args_schema) if args_schema is not None else None
+        self._tools[name] = Tool(
+            name=name,
+            description=description,
+            func=func,
+            args_schema=args_schema,
+            validator=validator,
+        )
 
     def get(self, name: str) -> Tool | None:
         """Return a tool by name, or ``None`` if not found."""
@@ -29,16 +52,30 @@ class ToolRegistry:
         """Return all registered tools."""
         return list(self._tools.values())
 
-    def execute(self, name: str, tool_input: str) -> str:
-        """Execute a tool by name with the given input string."""
+    def execute(self, name: str, tool_input: str | dict[str, Any]) -> str:
+        """Execute a tool by name with the given input.
+
+        Structured (``dict``) input is validated against the tool's
+        argument schema; tools without a schema receive it as a JSON string.
+        Raises ``ValueError`` for unknown tools or invalid arguments.
+        """
         tool = self.get(name)
         if tool is None:
             raise ValueError(f"Tool '{name}' not found")
-        return tool.func(tool_input)
+        if tool.validator is None:
+            if not isinstance(tool_input, str):
+                tool_input = json.dumps(tool_input)
+            return tool.func(tool_input)
+        if isinstance(tool_input, str):
+            return tool.func(tool.validator.validate_json(tool_input or "{}"))
+        return tool.func(tool.validator.validate_python(tool_input))
 
     def get_tool_descriptions(self) -> str:
         """Return a formatted multi-line string describing every registered tool."""
         lines = []
         for tool in self._tools.values():
-            lines.append(f"- {tool.name}: {tool.description}")
+            line = f"- {tool.name}: {tool.description}"
+            if tool.validator is not None:
+                line += f" (arguments schema: {json.dumps(tool.validator.json_schema())})"
+            lines.append(line)
         return "\n".join(lines)
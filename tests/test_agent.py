@@ -1,6 +1,8 @@
 """Tests for the ReAct agent loop."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+from pydantic import BaseModel
 
 from react_agent.agent import ReActAgent
 from react_agent.tools import ToolRegistry
@@ -12,6 +14,10 @@ def _make_registry_with_tool(name="search", description="Search the web", result
     return registry
 
 
+class SearchArgs(BaseModel):
+    query: str
+
+
 def test_agent_returns_final_answer_immediately():
     llm_fn = MagicMock(return_value="Thought: I know\nFinal Answer: 42")
     registry = _make_registry_with_tool()
@@ -129,3 +135,71 @@ def test_agent_multiple_steps():
     assert result.steps[0].action_input == "q1"
     assert result.steps[1].action_input == "q2"
     assert result.steps[2].action_input == "q3"
+
+
+def test_agent_json_output_format_with_schema():
+    llm_fn = MagicMock(
+        side_effect=[
+            '{"thought": "search", "action": "search", "action_input": {"query": "a\\nb"}}',
+            '{"thought": "done", "final_answer": "found"}',
+        ]
+    )
+    registry = ToolRegistry()
+    registry.register("search", "Search the web", lambda a: a.query.upper(), args_schema=SearchArgs)
+    agent = ReActAgent(llm_fn=llm_fn, tools=registry, output_format="json")
+
+    result = agent.run("structured question")
+
+    assert result.success is True
+    assert result.answer == "found"
+    assert result.steps[0].action_input == '{"query": "a\\nb"}'
+    assert result.steps[0].observation == "A\nB"
+    assert '"final_answer"' in llm_fn.call_args_list[0][0][0]
+
+
+def test_agent_json_output_format_reports_validation_error():
+    llm_fn = MagicMock(
+        side_effect=[
+            '{"thought": "search", "action": "search", "action_input": {}}',
+            "Thought: done\nFinal Answer: recovered",
+        ]
+    )
+    registry = ToolRegistry()
+    registry.register("search", "Search the web", lambda a: a.query, args_schema=SearchArgs)
+    agent = ReActAgent(llm_fn=llm_fn, tools=registry, output_format="json")
+
+    result = agent.run("bad arguments")
+
+    assert result.answer == "recovered"
+    assert result.steps[0].observation.startswith("Error:")
+
+
+def test_agent_records_tool_latency():
+    llm_fn = MagicMock(
+        side_effect=[
+            "Thought: search\nAction: search\nAction Input: q",
+            "Thought: done\nFinal Answer: ok",
+        ]
+    )
+    agent = ReActAgent(llm_fn=llm_fn, tools=_make_registry_with_tool())
+
+    with patch("react_agent.agent.time.perf_counter", side_effect=[10.0, 12.5]):
+        result = agent.run("timed question")
+
+    assert result.steps[0].latency == 2.5
+
+
+def test_agent_marks_failed_steps():
+    llm_fn = MagicMock(
+        side_effect=[
+            "Thought: a\nAction: nonexistent_tool\nAction Input: x",
+            "Thought: b\nAction: search\nAction Input: y",
+            "Thought: done\nFinal Answer: ok",
+        ]
+    )
+    agent = ReActAgent(llm_fn=llm_fn, tools=_make_registry_with_tool(result="Error: not really"))
+
+    result = agent.run("failing tool")
+
+    assert result.steps[0].failed is True
+    assert result.steps[1].failed is False
@@ -0,0 +1,188 @@
+"""Tests for TraceArchiveWriter and TraceArchive."""
+
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from react_agent.archive import TraceArchive, TraceArchiveWriter
+from react_agent.models import AgentResult, AgentStep
+
+
+def _sample_results():
+    return [
+        AgentResult(
+            answer="Paris",
+            steps=[
+                AgentStep("look it up", "search", "capital of France", "Paris", 0.5),
+                AgentStep("double check", "search", '{"q": "París"}', "Paris, France", 1.5),
+            ],
+        ),
+        AgentResult(
+            answer="Max iterations reached",
+            steps=[
+                AgentStep("compute", "calc", "1/0", "Error: division by zero", 0.25, True),
+                AgentStep("retry", "calc", "1/0", "Error: division by zero", 0.75, True),
+            ],
+            success=False,
+        ),
+        AgentResult(
+            answer="42",
+            steps=[AgentStep("read log", "search", "log", "Error: lines are fine", 0.5)],
+        ),
+        AgentResult(
+            answer="4",
+            steps=[AgentStep("line one\nline two", "calc", "2 + 2", "4", 1.0)],
+        ),
+    ]
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    path = tmp_path / "runs.trace"
+    with TraceArchiveWriter(path) as writer:
+        for result in _sample_results():
+            writer.add(result)
+    return path
+
+
+class TestTraceArchiveRoundTrip:
+    def test_counts(self, archive_path):
+        with TraceArchive(archive_path) as archive:
+            assert len(archive) == 4
+            assert archive.step_count == 6
+            assert archive.actions == ["search", "calc"]
+
+    def test_results_round_trip(self, archive_path):
+        with TraceArchive(archive_path) as archive:
+            assert list(archive) == _sample_results()
+
+    def test_result_index_out_of_range(self, archive_path):
+        with TraceArchive(archive_path) as archive:
+            with pytest.raises(IndexError):
+                archive.result(4)
+
+    def test_empty_archive(self, tmp_path):
+        path = tmp_path / "empty.trace"
+        TraceArchiveWriter(path).close()
+        with TraceArchive(path) as archive:
+            assert len(archive) == 0
+            assert archive.step_count == 0
+            assert archive.latency_by_tool() == {}
+
+    def test_add_after_close_raises(self, tmp_path):
+        writer = TraceArchiveWriter(tmp_path / "closed.trace")
+        writer.close()
+        with pytest.raises(ValueError, match="closed"):
+            writer.add(AgentResult(answer="x"))
+
+    def test_surrogates_round_trip(self, tmp_path):
+        path = tmp_path / "surrogates.trace"
+        result = AgentResult(answer="ok", steps=[AgentStep("t", "cat", "f", "bad \udc80 byte")])
+        with TraceArchiveWriter(path) as writer:
+            writer.add(result)
+        with TraceArchive(path) as archive:
+            assert archive.result(0) == result
+
+    def test_failed_add_leaves_archive_consistent(self, tmp_path):
+        path = tmp_path / "partial.trace"
+        good = AgentResult(answer="ok", steps=[AgentStep("t", "search", "q", "r")])
+        broken = AgentResult(
+            answer="broken",
+            steps=[AgentStep("t", "search", "q", "r"), AgentStep("t", "search", "q", None)],
+        )
+        with TraceArchiveWriter(path) as writer:
+            writer.add(good)
+            with pytest.raises(AttributeError):
+                writer.add(broken)
+            writer.add(good)
+        with TraceArchive(path) as archive:
+            assert len(archive) == 2
+            assert archive.step_count == 2
+            assert list(archive) == [good, good]
+
+    def test_exception_in_with_block_keeps_existing_file(self, archive_path):
+        original = archive_path.read_bytes()
+        with pytest.raises(RuntimeError):
+            with TraceArchiveWriter(archive_path) as writer:
+                writer.add(AgentResult(answer="x"))
+                raise RuntimeError("boom")
+        assert archive_path.read_bytes() == original
+
+    def test_misaligned_section_raises(self, archive_path):
+        data = bytearray(archive_path.read_bytes())
+        directory_start = 16
+        offset, size = struct.unpack_from("=2Q", data, directory_start)
+        struct.pack_into("=2Q", data, directory_start, offset, size - 1)
+        archive_path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="Corrupt trace archive"):
+            TraceArchive(archive_path)
+
+    def test_decreasing_offsets_raise_on_validate(self, archive_path):
+        data = bytearray(archive_path.read_bytes())
+        directory_start = 16 + 2 * 8 * 8  # "thought_offsets" is the ninth section
+        offset, _ = struct.unpack_from("=2Q", data, directory_start)
+        struct.pack_into("=Q", data, offset + 8, 10**6)
+        archive_path.write_bytes(bytes(data))
+        with TraceArchive(archive_path) as archive:
+            with pytest.raises(ValueError, match="thought_offsets"):
+                archive.validate()
+
+    def test_out_of_bounds_final_offset_raises_on_open(self, archive_path):
+        data = bytearray(archive_path.read_bytes())
+        directory_start = 16 + 2 * 8 * 8
+        offset, size = struct.unpack_from("=2Q", data, directory_start)
+        struct.pack_into("=Q", data, offset + size - 8, 10**6)
+        archive_path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="thought_offsets"):
+            TraceArchive(archive_path)
+
+    def test_validate_accepts_valid_archive(self, archive_path):
+        with TraceArchive(archive_path) as archive:
+            archive.validate()
+
+    def test_closed_archive_raises(self, archive_path):
+        archive = TraceArchive(archive_path)
+        archive.close()
+        with pytest.raises(ValueError, match="archive is closed"):
+            len(archive)
+        with pytest.raises(ValueError, match="archive is closed"):
+            archive.failed_runs("calc")
+
+    def test_failed_close_can_be_retried(self, tmp_path):
+        path = tmp_path / "retry.trace"
+        writer = TraceArchiveWriter(path)
+        writer.add(AgentResult(answer="kept"))
+        with patch("react_agent.archive.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                writer.close()
+        assert not path.exists()
+        assert list(tmp_path.iterdir()) == []
+        writer.close()
+        with TraceArchive(path) as archive:
+            assert archive.result(0).answer == "kept"
+
+    def test_invalid_file_raises(self, tmp_path):
+        path = tmp_path / "bogus.trace"
+        path.write_bytes(b"not an archive at all, just some bytes" * 4)
+        with pytest.raises(ValueError, match="Not a trace archive"):
+            TraceArchive(path)
+
+
+class TestTraceArchiveQueries:
+    def test_failed_runs(self, archive_path):
+        with TraceArchive(archive_path) as archive:
+            assert archive.failed_runs("calc") == [1]
+            assert archive.failed_runs("search") == []  # "Error: " output without failing
+            assert archive.failed_runs("unknown") == []
+
+    def test_latency_by_tool(self, archive_path):
+        with TraceArchive(archive_path) as archive:
+            stats = archive.latency_by_tool()
+        assert set(stats) == {"search", "calc"}
+        assert stats["search"].calls == 3
+        assert stats["search"].total == pytest.approx(2.5)
+        assert stats["search"].mean == pytest.approx(2.5 / 3)
+        assert stats["search"].maximum == pytest.approx(1.5)
+        assert stats["calc"].calls == 3
+        assert stats["calc"].maximum == pytest.approx(1.0)
@@ -99,12 +99,24 @@ class TestAgentStepMutability:
 
 
 class TestAgentStepDataclassFeatures:
-    def test_has_four_fields(self):
-        assert len(fields(AgentStep)) == 4
+    def test_has_six_fields(self):
+        assert len(fields(AgentStep)) == 6
 
     def test_field_names(self):
         names = [f.name for f in fields(AgentStep)]
-        assert names == ["thought", "action", "action_input", "observation"]
+        assert names == ["thought", "action", "action_input", "observation", "latency", "failed"]
+
+    def test_default_latency_is_zero(self):
+        assert AgentStep("t", "a", "i", "o").latency == 0.0
+
+    def test_default_failed_is_false(self):
+        assert AgentStep("t", "a", "i", "o").failed is False
+
+    def test_uses_slots(self):
+        step = AgentStep("t", "a", "i", "o")
+        assert not hasattr(step, "__dict__")
+        with pytest.raises(AttributeError):
+            step.extra = 1
 
     def test_equality(self):
         a = AgentStep("t", "a", "i", "o")
@@ -241,3 +253,6 @@ class TestAgentResultDataclassFeatures:
     def test_repr_contains_class_name(self):
         result = AgentResult(answer="test")
         assert "AgentResult" in repr(result)
+
+    def test_uses_slots(self):
+        assert not hasattr(AgentResult(answer="test"), "__dict__")
@@ -1,8 +1,8 @@
-"""Tests for parse_llm_output."""
+"""Tests for parse_llm_output and parse_json_output."""
 
 import pytest
 
-from react_agent.parser import ParsedAction, ParsedFinal, parse_llm_output
+from react_agent.parser import ParsedAction, ParsedFinal, parse_json_output, parse_llm_output
 
 
 class TestParseLLMOutput:
@@ -55,3 +55,116 @@ class TestParseLLMOutput:
         assert "Here are the results:" in result.answer
         assert "1. First item" in result.answer
         assert "2. Second item" in result.answer
+
+
+class TestParseJSONOutput:
+    def test_parse_action_with_structured_input(self):
+        text = (
+            '{"thought": "I need to search", "action": "search",\n'
+            ' "action_input": {"query": "python\\ntutorial", "limit": 3}}'
+        )
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.thought == "I need to search"
+        assert result.action == "search"
+        assert result.action_input == {"query": "python\ntutorial", "limit": 3}
+
+    def test_parse_final_answer(self):
+        text = '{"thought": "I now know", "final_answer": "Paris"}'
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedFinal)
+        assert result.thought == "I now know"
+        assert result.answer == "Paris"
+
+    def test_ignores_surrounding_text_and_code_fences(self):
+        text = (
+            "Here is my step {not json}:\n"
+            "```json\n"
+            '{"thought": "t", "action": "calc", "action_input": "2 + 2"}\n'
+            "```"
+        )
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "calc"
+        assert result.action_input == "2 + 2"
+
+    def test_accepts_prose_around_object(self):
+        text = 'Thought: checking the clock\n{"action": "get_time"}\nThat is my call.'
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "get_time"
+        assert result.action_input == ""
+
+    def test_skips_unrelated_json_objects(self):
+        result = parse_json_output('{"note": "ignore me"} {"action": "get_time"}')
+        assert isinstance(result, ParsedAction)
+        assert result.action == "get_time"
+
+    def test_ignores_hallucinated_observation(self):
+        text = (
+            '{"thought": "t", "action": "calc", "action_input": {"x": 1}}\n'
+            'Observation: {"r": 2}'
+        )
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "calc"
+        assert result.action_input == {"x": 1}
+
+    def test_ignores_braces_in_prose(self):
+        text = (
+            "Let me use {braces} here.\n"
+            '{"thought": "t", "action": "search", "action_input": "q"}'
+        )
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "search"
+
+    def test_accepts_any_fence_language(self):
+        text = '```python\n{"action": "search", "action_input": "q"}\n```'
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "search"
+
+    def test_text_format_with_json_action_input(self):
+        text = 'Thought: place it\nAction: order\nAction Input: {"action": "buy", "qty": 2}'
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "order"
+        assert result.action_input == '{"action": "buy", "qty": 2}'
+
+    def test_text_format_with_json_final_answer_key_in_input(self):
+        text = 'Thought: t\nAction: store\nAction Input: {"final_answer": "x"}'
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "store"
+
+    def test_null_final_answer_is_not_final(self):
+        text = '{"thought": "t", "final_answer": null, "action": "search", "action_input": "q"}'
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "search"
+
+    def test_null_final_answer_without_action_raises(self):
+        with pytest.raises(ValueError, match="Could not parse action"):
+            parse_json_output('{"thought": "t", "final_answer": null}')
+
+    def test_numeric_final_answer(self):
+        result = parse_json_output('{"final_answer": 42}')
+        assert isinstance(result, ParsedFinal)
+        assert result.answer == "42"
+
+    def test_structured_final_answer_is_serialized(self):
+        result = parse_json_output('{"final_answer": {"a": [1, 2]}}')
+        assert isinstance(result, ParsedFinal)
+        assert result.answer == '{"a": [1, 2]}'
+
+    def test_falls_back_to_text_format(self):
+        text = "Thought: Let me check\nAction: search\nAction Input: q"
+        result = parse_json_output(text)
+        assert isinstance(result, ParsedAction)
+        assert result.action == "search"
+        assert result.action_input == "q"
+
+    def test_unparseable_raises(self):
+        with pytest.raises(ValueError, match="Could not parse action"):
+            parse_json_output('{"thought": "hmm"')
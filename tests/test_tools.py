@@ -1,10 +1,16 @@
 """Tests for ToolRegistry."""
 
 import pytest
+from pydantic import BaseModel
 
 from react_agent.tools import ToolRegistry
 
 
+class SearchArgs(BaseModel):
+    query: str
+    limit: int = 5
+
+
 class TestToolRegistry:
     def setup_method(self):
         self.registry = ToolRegistry()
@@ -50,3 +56,28 @@ class TestToolRegistry:
         assert tool.description == "New description"
         assert tool.func("x") == "new"
         assert len(self.registry.list_tools()) == 1
+
+    def test_execute_validates_structured_input(self):
+        self.registry.register(
+            "search", "Search", lambda a: f"{a.query}:{a.limit}", args_schema=SearchArgs
+        )
+        assert self.registry.execute("search", {"query": "py", "limit": "2"}) == "py:2"
+
+    def test_execute_validates_json_string_input(self):
+        self.registry.register("search", "Search", lambda a: a.query, args_schema=SearchArgs)
+        assert self.registry.execute("search", '{"query": "py"}') == "py"
+
+    def test_execute_invalid_arguments_raises_value_error(self):
+        self.registry.register("search", "Search", lambda a: a.query, args_schema=SearchArgs)
+        with pytest.raises(ValueError, match="query"):
+            self.registry.execute("search", {"limit": 1})
+
+    def test_execute_dict_input_without_schema_passes_json(self):
+        self.registry.register("echo", "Echo", lambda q: q)
+        assert self.registry.execute("echo", {"a": 1}) == '{"a": 1}'
+
+    def test_get_tool_descriptions_includes_schema(self):
+        self.registry.register("search", "Search the web", lambda a: "", args_schema=SearchArgs)
+        desc = self.registry.get_tool_descriptions()
+        assert desc.startswith("- search: Search the web (arguments schema:")
+        assert '"query"' in desc